@@ -0,0 +1,84 @@
+"""Static instructions for the plant agents and their prompt cache keys."""
+
+import dataclasses
+import hashlib
+from typing import Any, Union
+
+import orjson
+from agents import Agent, FunctionTool, Handoff, HostedMCPTool, Tool
+
+MANAGER_AGENT_INSTRUCTIONS = """
+You are the Manager Agent.
+Your role is to interact with users, collect their preferences,
+and manage the plant buying process.
+
+1. Collect user inputs for light conditions and maintenance level.
+2. Automatically handoff the task to the Plant Expert Agent to get
+plant recommendations.
+
+Once the Plant Expert Agent has provided the recommendations it will
+handoff the task back to you.
+You then need to buy the plants that were recommended.
+
+3. Use the buy_plants tool to buy the plants that were recommended.
+4. You MUST use the empower-mcp get_products to get the products that
+would fit well with the plants that were ordered.
+
+Keep interactions clear and concise. Do not ask for confirmation;
+proceed directly with the workflow.
+Report back to the user with the ordered plants and the products that
+ would fit well with the plants."""
+
+PLANT_EXPERT_AGENT_INSTRUCTIONS = """You are the Plant Expert Agent.
+Your role is to provide plant recommendations based on user criteria.
+
+1. Use the get_plant_basic_info tool to gather basic information about plants.
+2. Use the get_plant_recommendations tool to recommend plants based
+on light and maintenance criteria.
+
+Provide clear and concise recommendations. Always ensure the recommendations
+match the user's criteria.
+Once you have provided the recommendations, handoff the task
+back to the Manager Agent."""
+
+
+def _tool_definition(tool: Tool) -> Any:
+    """Return the parts of a tool that are sent to the model as its definition."""
+    if isinstance(tool, FunctionTool):
+        return [tool.name, tool.description, tool.params_json_schema]
+    if isinstance(tool, HostedMCPTool):
+        return dict(tool.tool_config)
+    return tool.name
+
+
+def _handoff_definition(handoff: Union[Agent[Any], Handoff[Any, Any]]) -> Any:
+    """Return the parts of a handoff that are sent to the model as its tool."""
+    if isinstance(handoff, Handoff):
+        return [handoff.tool_name, handoff.tool_description, handoff.input_json_schema]
+    return [handoff.name, handoff.handoff_description]
+
+
+def prompt_cache_key(agent: Agent[Any]) -> str:
+    """Derive the provider prompt cache key for an agent's static prefix.
+
+    The key hashes the instructions, tool definitions and handoffs sent ahead
+    of the user input, so it changes exactly when that prefix does. Handoffs
+    can be wired after construction, so derive it once they are in place.
+    """
+    tool_definitions = [_tool_definition(tool) for tool in agent.tools]
+    handoff_definitions = [_handoff_definition(handoff) for handoff in agent.handoffs]
+    digest = hashlib.blake2b(
+        orjson.dumps(
+            [agent.instructions, tool_definitions, handoff_definitions],
+            option=orjson.OPT_SORT_KEYS,
+        ),
+        digest_size=8,
+    ).hexdigest()
+    return f"{agent.name}-{digest}"
+
+
+def set_prompt_cache_key(agent: Agent[Any]) -> None:
+    """Send the agent's current prompt cache key with its model requests."""
+    agent.model_settings = dataclasses.replace(
+        agent.model_settings, extra_body={"prompt_cache_key": prompt_cache_key(agent)}
+    )
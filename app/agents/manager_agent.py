@@ -1,77 +1,94 @@
 """Manager Agent to handle user inputs and initiate handoffs."""
 
+import asyncio
+import functools
 import logging
-import os
+from typing import AsyncIterator, List, Optional, Tuple, Union
 
-from agents import Agent, HostedMCPTool, Runner
+from agents import Agent, HostedMCPTool, RawResponsesStreamEvent, Runner
+from openai.types.responses import ResponseTextDeltaEvent
+from openai.types.responses.tool_param import Mcp
 
 from config import settings
 
+from ..cache import response_cache
 from ..tools.buy_plants import buy_plants_tool
-from .plant_expert_agent import plant_expert_agent
+from ._prompts import MANAGER_AGENT_INSTRUCTIONS, set_prompt_cache_key
+from .plant_expert_agent import get_plant_expert_agent
 
-# Configure logging
-logging.basicConfig(level=logging.DEBUG)
+# Manager agent configuration
+MANAGER_AGENT_NAME = "manager_agent"
 
+# Caps agent runs across all requests (single, streamed and bulk) so a burst
+# can't flood the model provider
+_agent_runs = asyncio.Semaphore(settings.llm_concurrency)
 
-# Set OpenAI API key
-os.environ["OPENAI_API_KEY"] = settings.openai_api_key
 
-# Manager agent configuration
-MANAGER_AGENT_NAME = "manager_agent"
-MANAGER_AGENT_INSTRUCTIONS = """
-You are the Manager Agent.
-Your role is to interact with users, collect their preferences,
-and manage the plant buying process.
-
-1. Collect user inputs for light conditions and maintenance level.
-2. Automatically handoff the task to the Plant Expert Agent to get
-plant recommendations.
-
-Once the Plant Expert Agent has provided the recommendations it will
-handoff the task back to you.
-You then need to buy the plants that were recommended.
-
-3. Use the buy_plants tool to buy the plants that were recommended.
-4. You MUST use the empower-mcp get_products to get the products that
-would fit well with the plants that were ordered.
-
-Keep interactions clear and concise. Do not ask for confirmation;
-proceed directly with the workflow.
-Report back to the user with the ordered plants and the products that
- would fit well with the plants."""
-
-# Create the manager agent
-manager_agent = Agent(
-    name=MANAGER_AGENT_NAME,
-    instructions=MANAGER_AGENT_INSTRUCTIONS,
-    model=settings.agent_model,  # Use a more expansive model for managing tasks
-    tools=[],  # Add buyPlants tool later
-)
-
-# Set up handoffs
-manager_agent.handoffs = [
-    plant_expert_agent
-]  # Manager agent can handoff to plant expert agent
-plant_expert_agent.handoffs = [
-    manager_agent
-]  # Plant expert agent can handoff back to manager agent
-
-
-# Update the manager agent to include the buyPlants tool
-manager_agent.tools.append(buy_plants_tool)
-
-# Configure the MCP tool
-mcp_tool = HostedMCPTool(
-    tool_config={
+@functools.cache
+def get_mcp_tool() -> HostedMCPTool:
+    """Build the empower-mcp tool on first use.
+
+    A single hosted tool is shared by every run; it is executed on the model
+    provider's side, so the app itself never opens an MCP connection.
+    """
+    tool_config: Mcp = {
         "type": "mcp",  # Specify the tool type
         "server_label": "empower-mcp",
         "server_url": settings.mcp_server_url,  # Ensure this is set in your config
         "require_approval": "never",
     }
-)
 
-manager_agent.tools.append(mcp_tool)
+    # Only list the tools the agent needs to keep the tools/list payload small
+    allowed_tools = [
+        tool.strip() for tool in settings.mcp_allowed_tools.split(",") if tool.strip()
+    ]
+    if allowed_tools:
+        tool_config["allowed_tools"] = allowed_tools
+
+    return HostedMCPTool(tool_config=tool_config)
+
+
+@functools.cache
+def get_manager_agent() -> Agent:
+    """Build the manager agent and wire its handoffs on first use."""
+    plant_expert_agent = get_plant_expert_agent()
+
+    # Create the manager agent with its tools and handoffs in a single pass
+    manager_agent = Agent(
+        name=MANAGER_AGENT_NAME,
+        instructions=MANAGER_AGENT_INSTRUCTIONS,
+        model=settings.agent_model,  # Use a more expansive model for managing tasks
+        tools=[buy_plants_tool, get_mcp_tool()],
+        handoffs=[plant_expert_agent],  # Manager agent can handoff to plant expert
+    )
+
+    # Close the cycle: plant expert agent can handoff back to manager agent
+    plant_expert_agent.handoffs = [manager_agent]
+
+    # Handoffs are part of the prompt prefix, so key both agents once wired
+    set_prompt_cache_key(manager_agent)
+    set_prompt_cache_key(plant_expert_agent)
+
+    return manager_agent
+
+
+@functools.lru_cache(maxsize=256)
+def _format_purchase_message(light: str, maintenance: str) -> str:
+    """Build the manager agent prompt for the given preferences."""
+    return f"I want to buy plants for {light} light and {maintenance} maintenance."
+
+
+async def _run_purchase(message: str, cache_key: Optional[str] = None) -> str:
+    """Run the manager agent on a purchase message, caching the result if keyed."""
+    # Run the agent to get recommendations
+    async with _agent_runs:
+        result = await Runner.run(get_manager_agent(), message)
+
+    logging.debug("manager_agent completed purchase: %s", result.final_output)
+    response = str(result.final_output)
+    if cache_key is not None:
+        await response_cache.set(cache_key, response)
+    return response
 
 
 async def process_user_request(light: str, maintenance: str) -> str:
@@ -86,14 +103,70 @@ async def process_user_request(light: str, maintenance: str) -> str:
     """
 
     logging.debug(
-        f"manager_agent invoked with light: {light}, maintenance: {maintenance}"
+        "manager_agent invoked with light: %s, maintenance: %s", light, maintenance
+    )
+    # Create a message with user preferences
+    message = _format_purchase_message(light, maintenance)
+
+    # Purchases have side effects, so serving them from the cache and
+    # coalescing identical ones is opt-in
+    if not settings.response_cache_enabled:
+        return await _run_purchase(message)
+
+    cache_key = response_cache.cache_key(MANAGER_AGENT_NAME, message)
+    cached = await response_cache.get(cache_key)
+    if cached is not None:
+        logging.debug("manager_agent served purchase from cache")
+        return cached
+
+    # Identical purchases already in flight share one agent run
+    return await response_cache.run_or_await(
+        cache_key, functools.partial(_run_purchase, message, cache_key)
+    )
+
+
+async def stream_user_request(light: str, maintenance: str) -> AsyncIterator[str]:
+    """Stream the plant purchase workflow output as it is generated.
+
+    Args:
+        light: Light conditions
+        maintenance: Maintenance level
+
+    Yields:
+        Text deltas produced by the agents during the run
+    """
+
+    logging.debug(
+        "manager_agent streaming with light: %s, maintenance: %s", light, maintenance
     )
     # Create a message with user preferences
-    message = f"I want to buy plants for {light} light and {maintenance} maintenance."
+    message = _format_purchase_message(light, maintenance)
 
-    # Run the agent to get recommendations
-    result = await Runner.run(manager_agent, message)
+    # Run the agent and forward text deltas as they arrive
+    async with _agent_runs:
+        result = Runner.run_streamed(get_manager_agent(), message)
+        async for event in result.stream_events():
+            if isinstance(event, RawResponsesStreamEvent) and isinstance(
+                event.data, ResponseTextDeltaEvent
+            ):
+                yield event.data.delta
+
+    logging.debug("manager_agent completed streamed purchase: %s", result.final_output)
+
+
+async def process_user_requests_bulk(
+    requests: List[Tuple[str, str]],
+) -> List[Union[str, BaseException]]:
+    """Process several plant purchase requests concurrently.
 
-    logging.debug(f"manager_agent completed purchase: {result.final_output}")
-    print(result)
-    return str(result.final_output)
+    Args:
+        requests: (light, maintenance) pairs to process
+
+    Returns:
+        Confirmation or raised exception for each request, in input order
+    """
+    # Each item's agent run takes a slot of the shared agent run cap
+    return await asyncio.gather(
+        *(process_user_request(light, maintenance) for light, maintenance in requests),
+        return_exceptions=True,
+    )
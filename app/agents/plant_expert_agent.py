@@ -1,42 +1,42 @@
 """Plant Expert Agent to handle plant recommendation requests."""
 
+import functools
 import logging
-import os
 
-from agents import Agent, Runner
+from agents import Agent, Runner, set_default_openai_key
 
 from config import settings
 
 from ..tools.plant_base_info import plant_base_info_tool
 from ..tools.plant_recommendations import plant_recommendation_tool
-
-# Configure logging
-logging.basicConfig(level=logging.DEBUG)
-
-# Set OpenAI API key
-os.environ["OPENAI_API_KEY"] = settings.openai_api_key
+from ._prompts import PLANT_EXPERT_AGENT_INSTRUCTIONS, set_prompt_cache_key
 
 # Plant expert agent configuration
 PLANT_EXPERT_AGENT_NAME = "plant_expert_agent"
-PLANT_EXPERT_AGENT_INSTRUCTIONS = """You are the Plant Expert Agent.
-Your role is to provide plant recommendations based on user criteria.
 
-1. Use the get_plant_basic_info tool to gather basic information about plants.
-2. Use the get_plant_recommendations tool to recommend plants based
-on light and maintenance criteria.
 
-Provide clear and concise recommendations. Always ensure the recommendations
-match the user's criteria.
-Once you have provided the recommendations, handoff the task
-back to the Manager Agent."""
+@functools.cache
+def get_plant_expert_agent() -> Agent:
+    """Build the plant expert agent on first use."""
+    # Hand the OpenAI API key to the SDK without touching the process environment
+    if settings.openai_api_key:
+        set_default_openai_key(settings.openai_api_key)
+
+    # Create the plant expert agent
+    plant_expert_agent = Agent(
+        name=PLANT_EXPERT_AGENT_NAME,
+        instructions=PLANT_EXPERT_AGENT_INSTRUCTIONS,
+        model=settings.light_model,  # Use a cheaper model for simple recommendations
+        tools=[plant_base_info_tool, plant_recommendation_tool],
+    )
+    set_prompt_cache_key(plant_expert_agent)
+    return plant_expert_agent
+
 
-# Create the plant expert agent
-plant_expert_agent = Agent(
-    name=PLANT_EXPERT_AGENT_NAME,
-    instructions=PLANT_EXPERT_AGENT_INSTRUCTIONS,
-    model=settings.light_model,  # Use a cheaper model for simple recommendations
-    tools=[plant_base_info_tool, plant_recommendation_tool],
-)
+@functools.lru_cache(maxsize=256)
+def _format_recommendation_message(light: str, maintenance: str) -> str:
+    """Build the plant expert agent prompt for the given criteria."""
+    return f"Reccomend plants for {light} light and {maintenance} maintenance."
 
 
 async def get_recommendations(light: str, maintenance: str) -> str:
@@ -51,13 +51,13 @@ async def get_recommendations(light: str, maintenance: str) -> str:
     """
 
     logging.debug(
-        f"PlantExpertAgent invoked with light: {light}, maintenance: {maintenance}"
+        "PlantExpertAgent invoked with light: %s, maintenance: %s", light, maintenance
     )
     # Create a message with user preferences
-    msg = f"Reccomend plants for {light} light and {maintenance} maintenance."
+    msg = _format_recommendation_message(light, maintenance)
 
     # Run the agent
-    result = await Runner.run(plant_expert_agent, msg)
+    result = await Runner.run(get_plant_expert_agent(), msg)
 
-    logging.debug(f"PlantExpertAgent provided recommendations: {result.final_output}")
+    logging.debug("PlantExpertAgent provided recommendations: %s", result.final_output)
     return str(result.final_output)
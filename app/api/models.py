@@ -1,48 +1,86 @@
 """Pydantic models for API requests and responses."""
 
+from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ChatResponse(BaseModel):
     """Response model for chat endpoint."""
 
+    model_config = ConfigDict(
+        extra="ignore",
+        frozen=True,
+        json_schema_extra={
+            "example": {
+                "response": "Yellow leaves on a pothos can indicate overwatering...",
+                "agent_name": "EmpowerPlantAgent",
+            }
+        },
+    )
+
     response: str = Field(..., description="Agent's response")
     agent_name: str = Field(..., description="Name of the responding agent")
 
-    class Config:
-        schema_extra = {
+
+class BulkPurchaseResult(BaseModel):
+    """Result of one purchase in a bulk plant purchase request."""
+
+    model_config = ConfigDict(
+        extra="ignore",
+        frozen=True,
+        json_schema_extra={
             "example": {
-                "response": "Yellow leaves on a pothos can indicate overwatering...",
-                "agent_name": "EmpowerPlantAgent",
+                "response": "I bought a snake plant and a ZZ plant for you...",
+                "agent_name": "manager_agent",
+                "error": None,
             }
-        }
+        },
+    )
+
+    response: Optional[str] = Field(
+        default=None, description="Agent's response, if the purchase succeeded"
+    )
+    agent_name: str = Field(..., description="Name of the responding agent")
+    error: Optional[str] = Field(
+        default=None, description="Why the purchase failed, if it did"
+    )
 
 
 class HealthResponse(BaseModel):
     """Response model for health check endpoint."""
 
-    status: str = Field(..., description="Service status")
-    agent_name: str = Field(..., description="Agent name")
-    version: str = Field(..., description="API version")
-
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        extra="ignore",
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "status": "healthy",
                 "agent_name": "EmpowerPlantAgent",
                 "version": "1.0.0",
+                "cache_hits": 42,
+                "cache_misses": 7,
             }
-        }
+        },
+    )
+
+    status: str = Field(..., description="Service status")
+    agent_name: str = Field(..., description="Agent name")
+    version: str = Field(..., description="API version")
+    cache_hits: int = Field(0, description="Agent response cache hits")
+    cache_misses: int = Field(0, description="Agent response cache misses")
 
 
 class PlantPurchaseRequest(BaseModel):
     """Request model for plant purchase endpoint."""
 
+    model_config = ConfigDict(
+        extra="ignore",
+        frozen=True,
+        json_schema_extra={"example": {"light": "full sun", "maintenance": "low"}},
+    )
+
     light: str = Field(..., description="Light conditions for the plants", min_length=1)
     maintenance: str = Field(
         ..., description="Maintenance level for the plants", min_length=1
     )
-
-    class Config:
-        schema_extra = {"example": {"light": "full sun", "maintenance": "low"}}
@@ -1,23 +1,64 @@
 """Simple API routes for the plant care agent."""
 
+import logging
+from typing import Annotated, AsyncIterator, List, Optional
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Body, HTTPException
+from fastapi.responses import Response, StreamingResponse
 
-from ..agents.manager_agent import process_user_request
-from .models import ChatResponse, HealthResponse, PlantPurchaseRequest
+from config import settings
+
+from ..agents.manager_agent import (
+    MANAGER_AGENT_NAME,
+    process_user_request,
+    process_user_requests_bulk,
+    stream_user_request,
+)
+from ..cache import response_cache
+from ..serialization import (
+    BULK_PURCHASE_RESULTS_ADAPTER,
+    CHAT_RESPONSE_ADAPTER,
+    HEALTH_RESPONSE_ADAPTER,
+    json_response,
+)
+from .models import (
+    BulkPurchaseResult,
+    ChatResponse,
+    HealthResponse,
+    PlantPurchaseRequest,
+)
+
+logger = logging.getLogger(__name__)
 
 # Initialize router
 router = APIRouter()
 
 
-@router.get("/health", response_model=HealthResponse)  # type: ignore[misc]
-async def health_check() -> HealthResponse:
+def _chat_response(response: str) -> Response:
+    """Serialize a manager agent response without re-validating it."""
+    chat = ChatResponse(response=response, agent_name=MANAGER_AGENT_NAME)
+    return json_response(CHAT_RESPONSE_ADAPTER, chat)
+
+
+@router.get(
+    "/health", response_model=None, responses={200: {"model": HealthResponse}}
+)  # type: ignore[misc]
+async def health_check() -> Response:
     """Health check endpoint."""
-    return HealthResponse(status="healthy", agent_name="", version="1.0.0")
+    health = HealthResponse(
+        status="healthy",
+        agent_name="",
+        version="1.0.0",
+        cache_hits=response_cache.hits,
+        cache_misses=response_cache.misses,
+    )
+    return json_response(HEALTH_RESPONSE_ADAPTER, health)
 
 
-@router.post("/buy-plants", response_model=ChatResponse)  # type: ignore[misc]
-async def buy_plants(request: PlantPurchaseRequest) -> ChatResponse:
+@router.post(
+    "/buy-plants", response_model=None, responses={200: {"model": ChatResponse}}
+)  # type: ignore[misc]
+async def buy_plants(request: PlantPurchaseRequest) -> Response:
     """Trigger the plant purchase workflow.
 
     Args:
@@ -34,9 +75,105 @@ async def buy_plants(request: PlantPurchaseRequest) -> ChatResponse:
             light=request.light, maintenance=request.maintenance
         )
 
-        return ChatResponse(response=response, agent_name="manager_agent")
+        return _chat_response(response)
 
     except Exception as e:
+        # The 500 is reported to Sentry with `e` as its cause, so logging it
+        # here as well would open a duplicate issue
         raise HTTPException(
             status_code=500, detail=f"Failed to process plant purchase: {str(e)}"
-        )
+        ) from e
+
+
+def _sse_frame(data: str, event: Optional[str] = None) -> str:
+    """Frame a piece of text as one Server-Sent Event."""
+    # Multi-line data becomes one data field per line, as SSE requires
+    lines = "".join(f"data: {line}\n" for line in data.split("\n"))
+    return f"event: {event}\n{lines}\n" if event else f"{lines}\n"
+
+
+async def _sse_events(chunks: AsyncIterator[str]) -> AsyncIterator[str]:
+    """Frame text chunks as Server-Sent Events.
+
+    A failure mid-stream ends it with an `error` event rather than cutting the
+    stream off, so clients can tell a failed run from a finished one.
+    """
+    try:
+        async for chunk in chunks:
+            yield _sse_frame(chunk)
+    except Exception as e:
+        logger.exception("Failed to stream plant purchase")
+        yield _sse_frame(f"Failed to process plant purchase: {str(e)}", event="error")
+
+
+@router.post(
+    "/buy-plants/stream", response_class=StreamingResponse
+)  # type: ignore[misc]
+async def buy_plants_stream(request: PlantPurchaseRequest) -> StreamingResponse:
+    """Trigger the plant purchase workflow and stream its output.
+
+    Args:
+        request: Request containing light and maintenance preferences
+
+    Returns:
+        Server-Sent Events stream with the agents' output text
+    """
+    return StreamingResponse(
+        _sse_events(
+            stream_user_request(light=request.light, maintenance=request.maintenance)
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.post(
+    "/buy-plants/bulk",
+    response_model=None,
+    responses={
+        200: {"model": List[BulkPurchaseResult]},
+        207: {
+            "model": List[BulkPurchaseResult],
+            "description": "Some of the purchases failed",
+        },
+    },
+)  # type: ignore[misc]
+async def buy_plants_bulk(
+    requests: Annotated[
+        List[PlantPurchaseRequest], Body(max_length=settings.bulk_max_requests)
+    ],
+) -> Response:
+    """Trigger several plant purchase workflows concurrently.
+
+    Args:
+        requests: Requests containing light and maintenance preferences
+
+    Returns:
+        Result of each plant purchase, in request order, with 207 Multi-Status
+        if any of them failed
+    """
+    results = await process_user_requests_bulk(
+        [(request.light, request.maintenance) for request in requests]
+    )
+
+    responses = []
+    for result in results:
+        if isinstance(result, BaseException):
+            logger.error("Failed to process plant purchase", exc_info=result)
+            responses.append(
+                BulkPurchaseResult(
+                    agent_name=MANAGER_AGENT_NAME,
+                    error=f"Failed to process plant purchase: {str(result)}",
+                )
+            )
+        else:
+            responses.append(
+                BulkPurchaseResult(response=result, agent_name=MANAGER_AGENT_NAME)
+            )
+
+    # The purchases that succeeded have already happened, so a failure is
+    # reported per item instead of failing the whole request
+    failed = any(response.error is not None for response in responses)
+    return json_response(
+        BULK_PURCHASE_RESULTS_ADAPTER, responses, status_code=207 if failed else 200
+    )
@@ -0,0 +1,87 @@
+"""In-memory response cache for agent runs."""
+
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Mapping, Optional, Tuple
+
+import orjson
+
+from config import settings
+
+
+class LLMCache:
+    """Exact-match LRU cache with TTL for agent responses."""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 3600) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = asyncio.Lock()
+        self._inflight: Dict[str, "asyncio.Future[str]"] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def cache_key(
+        agent_name: str, message: str, context: Optional[Mapping[str, Any]] = None
+    ) -> str:
+        """Build the cache key for a message (and optional context) sent to an agent.
+
+        The message is whitespace- and case-normalized and the context is sorted,
+        so trivially different requests share one entry.
+        """
+        payload = orjson.dumps(
+            [agent_name, message.strip().lower(), sorted((context or {}).items())]
+        )
+        return hashlib.blake2b(payload).hexdigest()
+
+    async def get(self, key: str) -> Optional[str]:
+        """Return the cached response for a key, if present and fresh."""
+        async with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    async def set(self, key: str, value: str) -> None:
+        """Store a response, evicting the least recently used entry if full."""
+        async with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    async def run_or_await(
+        self, key: str, factory: Callable[[], Awaitable[str]]
+    ) -> str:
+        """Run `factory` for a key, or join the identical run already in flight.
+
+        Concurrent callers with the same key share one result (or exception),
+        closing the stampede window between a cache miss and the cache being
+        filled. The shared run is shielded, so one caller being cancelled
+        doesn't cancel it for the others.
+        """
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(factory())
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(future)
+
+
+# Global response cache instance
+response_cache = LLMCache(
+    maxsize=settings.response_cache_maxsize, ttl=settings.response_cache_ttl
+)
@@ -1,6 +1,7 @@
 """Background jobs and tasks for the AI Agent application."""
 
 import asyncio
+import itertools
 import logging
 import random
 from dataclasses import dataclass
@@ -8,6 +9,7 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 import httpx
+import orjson
 
 from config import settings
 
@@ -22,6 +24,10 @@ class ApiTestItem:
     method: str = "POST"
     payload: Optional[Dict[str, Any]] = None
     name: str = ""
+    weight: int = 1
+    emoji: str = "🌱"
+    url: str = ""
+    body: bytes = b""
 
 
 class ApiTester:
@@ -32,12 +38,23 @@ class ApiTester:
         self.server_url = f"http://{settings.api_host}:{settings.api_port}"
         self.jitter_percent = settings.api_tester_jitter_percent
         self.enabled = settings.api_tester_enabled
+        self.max_connections = settings.api_tester_max_connections
+        self.max_keepalive = settings.api_tester_max_keepalive
         self.task: Optional[asyncio.Task] = None
+        self._stop_event: Optional[asyncio.Event] = None
+        self._call_in_flight = False
         self.client: Optional[httpx.AsyncClient] = None
+        self._rng = random.Random(settings.api_tester_seed)
+
+        # Seasonal multipliers indexed by [day_of_week][hour]
+        self._seasonal_table = [
+            [self._compute_seasonal_multiplier(day, hour) for hour in range(24)]
+            for day in range(7)
+        ]
 
         # Available API endpoints to test (equivalent to availableItems in TS)
         self.available_items: List[ApiTestItem] = [
-            # Plant agent endpoints (doubled for 2x probability like in TS)
+            # Plant agent endpoints (raise an item's weight to call it more often)
             ApiTestItem(
                 endpoint="/api/v1/buy-plants",
                 payload={"light": "low light", "maintenance": "high"},
@@ -70,86 +87,46 @@ class ApiTester:
             ),
         ]
 
-    async def start(self) -> None:
-        """Start the API tester background task."""
-        if not self.enabled:
-            logger.info("🚫 API tester is disabled")
-            return
-
-        try:
-            logger.info("🎨 Starting API tester...")
-            logger.info(f"📡 Server URL: {self.server_url}")
-            logger.info(f"⏱️  Base interval: {self.base_interval_ms}ms")
-            logger.info(f"🎯 Jitter: ±{self.jitter_percent}%")
-            logger.info(f"🎲 Available items: {len(self.available_items)} endpoints")
-
-            # Create HTTP client
-            self.client = httpx.AsyncClient(
-                # timeout=30.0,
-                headers={"Content-Type": "application/json"},
-            )
-
-            # Test connection
-            # await self.test_connection()
+        # Resolve full URLs and serialize static payloads once instead of on
+        # every call
+        for item in self.available_items:
+            item.url = f"{self.server_url}{item.endpoint}"
+            item.body = orjson.dumps(item.payload) if item.payload else b""
 
-            # Start the background task
-            self.task = asyncio.create_task(self._run_periodic_tests())
-
-            logger.info("✅ API tester started successfully")
-
-        except Exception as error:
-            logger.error(f"❌ Failed to start API tester: {error}")
-            raise
-
-    async def stop(self) -> None:
-        """Stop the API tester background task."""
-        logger.info("🛑 Stopping API tester...")
-
-        if self.task:
-            self.task.cancel()
-            try:
-                await self.task
-            except asyncio.CancelledError:
-                pass
-            self.task = None
-
-        if self.client:
-            await self.client.aclose()
-            self.client = None
-
-        logger.info("🛑 API tester stopped")
+        # Cumulative weights so random.choices doesn't rebuild them on every call
+        self._cum_weights = list(
+            itertools.accumulate(item.weight for item in self.available_items)
+        )
 
     async def test_connection(self) -> None:
         """Test connection to the API server."""
         try:
             if not self.client:
-                raise Exception("HTTP client not initialized")
+                raise RuntimeError("HTTP client not initialized")
 
             response = await self.client.get(f"{self.server_url}/api/v1/health")
             if response.status_code != 200:
-                raise Exception(
+                raise RuntimeError(
                     f"Health check failed with status {response.status_code}"
                 )
 
             result = response.json()
             logger.info(
-                f"🔗 Connected to API server - {result.get('status', 'unknown')}"
+                "🔗 Connected to API server - %s", result.get("status", "unknown")
             )
 
         except Exception as error:
-            logger.error(f"❌ Failed to connect to API server: {error}")
+            logger.error("❌ Failed to connect to API server: %s", error)
             raise
 
     def get_random_item(self) -> ApiTestItem:
         """Get a random API endpoint to test."""
-        return random.choice(self.available_items)
-
-    def get_seasonal_multiplier(self) -> float:
-        """Calculate seasonal multiplier based on time of day and day of week."""
-        now = datetime.now()
-        hour = now.hour
-        day_of_week = now.weekday()  # 0 = Monday, 6 = Sunday
+        (item,) = self._rng.choices(self.available_items, cum_weights=self._cum_weights)
+        return item
 
+    @staticmethod
+    def _compute_seasonal_multiplier(day_of_week: int, hour: int) -> float:
+        """Calculate seasonal multiplier for a day of week and hour of day."""
         # Time of day seasonality (peak hours have faster intervals)
         if 9 <= hour <= 17:  # Business hours - more active
             time_multiplier = 0.7  # 30% faster
@@ -166,19 +143,26 @@ class ApiTester:
 
         return time_multiplier * day_multiplier
 
+    def get_seasonal_multiplier(self, now: Optional[datetime] = None) -> float:
+        """Look up seasonal multiplier based on time of day and day of week."""
+        now = now or datetime.now()
+        # 0 = Monday, 6 = Sunday
+        return self._seasonal_table[now.weekday()][now.hour]
+
     def add_jitter(self, base_value: float) -> float:
         """Add random jitter to the base value."""
         jitter_amount = (self.jitter_percent / 100) * base_value
         random_jitter = (
-            (random.random() - 0.5) * 2 * jitter_amount
+            (self._rng.random() - 0.5) * 2 * jitter_amount
         )  # -jitter to +jitter
-        return max(1.0, base_value + random_jitter)  # Minimum 1 second
+        interval = base_value + random_jitter
+        return interval if interval > 1.0 else 1.0  # Minimum 1 second
 
-    def calculate_next_interval(self) -> float:
+    def calculate_next_interval(self, now: Optional[datetime] = None) -> float:
         """Calculate the next interval with seasonal adjustment and jitter."""
         seasonal_interval = (
             self.base_interval_ms / 1000.0
-        ) * self.get_seasonal_multiplier()
+        ) * self.get_seasonal_multiplier(now)
         return self.add_jitter(seasonal_interval)
 
     async def execute_random_call(self) -> None:
@@ -189,58 +173,123 @@ class ApiTester:
                 return
 
             item = self.get_random_item()
-            ts = datetime.now().isoformat()
-            emoji = "🌱"
-
-            logger.info(
-                f"\n{emoji} [{ts}] Calling {item.method} {item.endpoint} ({item.name})"
-            )
-
-            url = f"{self.server_url}{item.endpoint}"
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "\n%s [%s] Calling %s %s (%s)",
+                    item.emoji,
+                    datetime.now().isoformat(),
+                    item.method,
+                    item.endpoint,
+                    item.name,
+                )
 
             if item.method == "GET":
-                response = await self.client.get(url)
+                response = await self.client.get(item.url)
                 if response.status_code == 200:
                     logger.info("✅ Success")
                 else:
-                    logger.info(f"❌ Failed - Status {response.status_code}")
+                    logger.info("❌ Failed - Status %s", response.status_code)
             else:  # POST
-                response = await self.client.post(url, json=item.payload)
+                response = await self.client.post(item.url, content=item.body)
                 if response.status_code == 200:
                     logger.info("✅ Success")
                 else:
-                    logger.info(f"❌ Failed - Status {response.status_code}")
+                    logger.info("❌ Failed - Status %s", response.status_code)
 
         except Exception as error:
-            logger.info(f"❌ Failed - {str(error)}")
+            logger.info("❌ Failed - %s", error)
 
-    async def _run_periodic_tests(self) -> None:
-        """Run periodic API tests with dynamic intervals."""
-        try:
-            # Run immediately once
-            await self.execute_random_call()
+    def _next_interval(self) -> float:
+        """Calculate and log the delay before the next API test call."""
+        now = datetime.now()
+        next_interval = self.calculate_next_interval(now)
+        sm = self.get_seasonal_multiplier(now)
 
-            while True:
-                # Calculate next interval
-                next_interval = self.calculate_next_interval()
-                sm = self.get_seasonal_multiplier()
+        logger.info("⏰ Next call in %.1fs (seasonal: %.2fx)", next_interval, sm)
 
-                logger.info(
-                    f"⏰ Next call in {next_interval:.1f}s (seasonal: {sm:.2f}x)"
-                )
-                print(f"⏰ Next call in {next_interval:.1f}s (seasonal: {sm:.2f}x)")
+        return next_interval
+
+    async def run(self) -> None:
+        """Run periodic API test calls until `request_stop` is called.
+
+        Meant to be run as a background task for the lifetime of the app. The
+        first call runs immediately and each following one waits out a dynamic
+        interval, which a stop request cuts short. Errors are logged rather
+        than raised, so the tester can never take the app down with it.
+        """
+        if not self.enabled:
+            logger.info("🚫 API tester is disabled")
+            return
+
+        logger.info("🎨 Starting API tester...")
+        logger.info("📡 Server URL: %s", self.server_url)
+        logger.info("⏱️  Base interval: %sms", self.base_interval_ms)
+        logger.info("🎯 Jitter: ±%s%%", self.jitter_percent)
+        logger.info("🎲 Available items: %d endpoints", len(self.available_items))
+
+        # Events bind to the loop that first waits on them, so each run gets a
+        # fresh one rather than reusing an event from a previous lifespan
+        stop_event = self._stop_event = asyncio.Event()
+        self.task = asyncio.current_task()
 
-                # Wait for the calculated interval
-                await asyncio.sleep(next_interval)
+        try:
+            self.client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_keepalive,
+                ),
+                # Agent runs can take a while, so reads get a generous timeout
+                timeout=httpx.Timeout(connect=5.0, read=300.0, write=10.0, pool=5.0),
+                headers={"Content-Type": "application/json"},
+            )
 
-                # Execute the next call
-                await self.execute_random_call()
+            # Test connection
+            # await self.test_connection()
+
+            logger.info("✅ API tester started successfully")
+
+            while not stop_event.is_set():
+                try:
+                    self._call_in_flight = True
+                    await self.execute_random_call()
+                except Exception as error:
+                    logger.error("❌ Error in periodic API testing: %s", error)
+                finally:
+                    self._call_in_flight = False
+
+                try:
+                    await asyncio.wait_for(
+                        stop_event.wait(), timeout=self._next_interval()
+                    )
+                except asyncio.TimeoutError:
+                    pass
 
         except asyncio.CancelledError:
             logger.info("🛑 Periodic API testing cancelled")
-            raise
+            # Cancelling an in-flight call is how a stop request ends it
+            if not stop_event.is_set():
+                raise
         except Exception as error:
-            logger.error(f"❌ Error in periodic API testing: {error}")
+            logger.error("❌ API tester failed: %s", error)
+        finally:
+            if self.client:
+                await self.client.aclose()
+                self.client = None
+            self.task = None
+            logger.info("🛑 API tester stopped")
+
+    def request_stop(self) -> None:
+        """Ask the API tester to stop.
+
+        A pending wait ends immediately; an in-flight call is cancelled rather
+        than awaited, since agent runs can take minutes.
+        """
+        logger.info("🛑 Stopping API tester...")
+        # No event yet means the tester isn't running, so there is nothing to stop
+        if self._stop_event is not None:
+            self._stop_event.set()
+        if self._call_in_flight and self.task:
+            self.task.cancel()
 
 
 # Global API tester instance
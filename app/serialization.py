@@ -0,0 +1,24 @@
+"""Prebuilt JSON serializers for the hot API response shapes."""
+
+from typing import Any, List
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+from .api.models import BulkPurchaseResult, ChatResponse, HealthResponse
+
+# Built once at import, so no request pays for constructing a serializer
+CHAT_RESPONSE_ADAPTER = TypeAdapter(ChatResponse)
+BULK_PURCHASE_RESULTS_ADAPTER = TypeAdapter(List[BulkPurchaseResult])
+HEALTH_RESPONSE_ADAPTER = TypeAdapter(HealthResponse)
+
+
+def json_response(
+    adapter: TypeAdapter[Any], obj: Any, status_code: int = 200
+) -> Response:
+    """Serialize an object with a prebuilt adapter into a JSON response."""
+    return Response(
+        content=adapter.dump_json(obj),
+        status_code=status_code,
+        media_type="application/json",
+    )
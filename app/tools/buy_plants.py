@@ -2,11 +2,9 @@
 
 import logging
 
+import orjson
 from agents import FunctionTool
 
-# Configure logging
-logging.basicConfig(level=logging.DEBUG)
-
 
 def buy_plants(plants: list) -> str:
     """Simulate buying plants.
@@ -44,13 +42,11 @@ buy_plants_tool = FunctionTool(
 
 async def _invoke_buy_plants(input_json: str) -> str:
     """Invoke the buy plants tool."""
-    import json
-
     try:
-        logging.debug(f"Invoking buyPlants with input: {input_json}")
-        params = json.loads(input_json)
+        logging.debug("Invoking buyPlants with input: %s", input_json)
+        params = orjson.loads(input_json)
         plants = params.get("plants", [])
         return buy_plants(plants)
     except Exception as e:
-        logging.error(f"Error in buyPlants: {str(e)}")
+        logging.error("Error in buyPlants: %s", e)
         return f"Error processing purchase: {str(e)}"
@@ -1,14 +1,42 @@
 """Simple plant care tool that provides basic advice for a given plant name."""
 
 import logging
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Mapping
 
+import orjson
 from agents import FunctionTool
 
 from ..utils import maybe_throw
 
-# Configure logging
-logging.basicConfig(level=logging.DEBUG)
+# Basic plant database: name -> (water, light, tips)
+PLANT_DB: Mapping[str, tuple[str, str, str]] = MappingProxyType(
+    {
+        "rose": (
+            "Water regularly, keep soil moist but not waterlogged",
+            "Full sun (6+ hours daily)",
+            "Classic flowering plant. ",
+        ),
+        "sunflower": (
+            "Water deeply but infrequently, drought tolerant once established",
+            "Full sun all day",
+            "Fast-growing annual flower. Can grow very tall, may need staking.",
+        ),
+        "tulip": (
+            "Water moderately during growing season, reduce after flowering",
+            "Full sun to partial shade",
+            "Spring bulb flower. Plant bulbs in fall for spring blooms.",
+        ),
+    }
+)
+
+PLANT_INFO_TEMPLATE = (
+    "🌸 **{title} Basic Info**\n\n"
+    "**Watering**: {water}\n"
+    "**Light**: {light}\n"
+    "**Care Tip**: {tips}"
+)
+UNKNOWN_PLANT_TEMPLATE = "🌸 **{title}**\n\nNo specific information available."
 
 
 def get_plant_basic_info(plant_names: list) -> str:
@@ -20,61 +48,41 @@ def get_plant_basic_info(plant_names: list) -> str:
     Returns:
         Basic info for each plant
     """
-    plant_db = {
-        "rose": {
-            "water": "Water regularly, keep soil moist but not waterlogged",
-            "light": "Full sun (6+ hours daily)",
-            "tips": "Classic flowering plant. ",
-        },
-        "sunflower": {
-            "water": "Water deeply but infrequently, drought tolerant once established",
-            "light": "Full sun all day",
-            "tips": "Fast-growing annual flower. Can grow very tall, may need staking.",
-        },
-        "tulip": {
-            "water": "Water moderately during growing season, reduce after flowering",
-            "light": "Full sun to partial shade",
-            "tips": "Spring bulb flower. Plant bulbs in fall for spring blooms.",
-        },
-    }
-
     maybe_throw(0.1, Exception("Could not get plant basic info: Unknown plant"))
 
+    if not plant_names:
+        return ""
+
     # Collect info for each plant
-    info_list = []
-    for plant_name in plant_names:
-        plant_key = plant_name.lower().strip()
-        if plant_key in plant_db:
-            plant_info = plant_db[plant_key]
-            info_list.append(
-                f"🌸 **{plant_name.title()} Basic Info**\n\n"
-                f"**Watering**: {plant_info['water']}\n"
-                f"**Light**: {plant_info['light']}\n"
-                f"**Care Tip**: {plant_info['tips']}"
-            )
-        else:
-            info_list.append(
-                f"🌸 **{plant_name.title()}**\n\nNo specific information available."
-            )
-
-    return "\n\n".join(info_list)
+    return "\n\n".join(_format_plant_info(plant_name) for plant_name in plant_names)
+
+
+def _format_plant_info(plant_name: str) -> str:
+    """Format the basic info block for a single plant."""
+    plant_info = PLANT_DB.get(plant_name.lower().strip())
+    title = plant_name.title()
+    if plant_info is None:
+        return UNKNOWN_PLANT_TEMPLATE.format_map({"title": title})
+
+    water, light, tips = plant_info
+    return PLANT_INFO_TEMPLATE.format_map(
+        {"title": title, "water": water, "light": light, "tips": tips}
+    )
 
 
 async def _invoke_plant_advice(context: Any, input_json: str) -> str:
     """Invoke the plant advice tool."""
-    import json
-
     maybe_throw(0.2, Exception("Could not get plant advice: File not found"))
 
     try:
-        logging.debug(f"Invoking get_plant_basic_info with input: {input_json}")
-        params = json.loads(input_json)
+        logging.debug("Invoking get_plant_basic_info with input: %s", input_json)
+        params = orjson.loads(input_json)
         plant_names = params.get("plant_names", [])
         if not plant_names:
             return "Please provide plant names to get care advice."
         return get_plant_basic_info(plant_names)
     except Exception as e:
-        logging.error(f"Error in get_plant_basic_info: {str(e)}")
+        logging.error("Error in get_plant_basic_info: %s", e)
         return f"Error getting plant advice: {str(e)}"
 
 
@@ -1,11 +1,39 @@
 """Tool to recommend plants based on light and maintenance criteria."""
 
+import functools
 import logging
+from types import MappingProxyType
+from typing import Mapping
 
+import orjson
 from agents import FunctionTool
 
-# Configure logging
-logging.basicConfig(level=logging.DEBUG)
+# Simple plant recommendation database
+PLANT_RECOMMENDATIONS: Mapping[str, Mapping[str, tuple[str, ...]]] = MappingProxyType(
+    {
+        "full sun": MappingProxyType(
+            {
+                "low": ("Cactus", "Lavender"),
+                "medium": ("Rose", "Sunflower"),
+                "high": ("Bougainvillea",),
+            }
+        ),
+        "partial shade": MappingProxyType(
+            {
+                "low": ("Snake Plant", "ZZ Plant"),
+                "medium": ("Peace Lily", "Fiddle Leaf Fig"),
+                "high": ("Gardenia",),
+            }
+        ),
+        "low light": MappingProxyType(
+            {
+                "low": ("Pothos", "Spider Plant"),
+                "medium": ("Philodendron", "Dracaena"),
+                "high": ("Orchid",),
+            }
+        ),
+    }
+)
 
 
 def get_plant_recommendations(light: str, maintenance: str) -> str:
@@ -18,36 +46,21 @@ def get_plant_recommendations(light: str, maintenance: str) -> str:
     Returns:
         Recommended plants to buy
     """
-    # Simple plant recommendation database
-    plant_recommendations = {
-        "full sun": {
-            "low": ["Cactus", "Lavender"],
-            "medium": ["Rose", "Sunflower"],
-            "high": ["Bougainvillea"],
-        },
-        "partial shade": {
-            "low": ["Snake Plant", "ZZ Plant"],
-            "medium": ["Peace Lily", "Fiddle Leaf Fig"],
-            "high": ["Gardenia"],
-        },
-        "low light": {
-            "low": ["Pothos", "Spider Plant"],
-            "medium": ["Philodendron", "Dracaena"],
-            "high": ["Orchid"],
-        },
-    }
-
     # Normalize input
-    light_key = light.lower().strip()
-    maintenance_key = maintenance.lower().strip()
+    return _get_plant_recommendations_cached(
+        light.lower().strip(), maintenance.lower().strip()
+    )
 
-    # Get recommendations
-    recommendations = plant_recommendations.get(light_key, {}).get(maintenance_key, [])
+
+@functools.lru_cache(maxsize=256)
+def _get_plant_recommendations_cached(light_key: str, maintenance_key: str) -> str:
+    """Build the recommendation response for normalized criteria."""
+    recommendations = PLANT_RECOMMENDATIONS.get(light_key, {}).get(maintenance_key, ())
 
     if recommendations:
         return (
-            f"🌿 Recommended Plants for {light.title()} and "
-            f"{maintenance.title()} Maintenance: {', '.join(recommendations)}"
+            f"🌿 Recommended Plants for {light_key.title()} and "
+            f"{maintenance_key.title()} Maintenance: {', '.join(recommendations)}"
         )
     else:
         return (
@@ -85,11 +98,9 @@ plant_recommendation_tool = FunctionTool(
 
 async def _invoke_plant_recommendations(input_json: str) -> str:
     """Invoke the plant recommendation tool."""
-    import json
-
     try:
-        logging.debug(f"Invoking get_plant_recommendations with input: {input_json}")
-        params = json.loads(input_json)
+        logging.debug("Invoking get_plant_recommendations with input: %s", input_json)
+        params = orjson.loads(input_json)
         light = params.get("light", "")
         maintenance = params.get("maintenance", "")
         if not light or not maintenance:
@@ -99,5 +110,5 @@ async def _invoke_plant_recommendations(input_json: str) -> str:
             )
         return get_plant_recommendations(light, maintenance)
     except Exception as e:
-        logging.error(f"Error in get_plant_recommendations: {str(e)}")
+        logging.error("Error in get_plant_recommendations: %s", e)
         return f"Error getting plant recommendations: {str(e)}"
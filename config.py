@@ -1,21 +1,44 @@
 """Configuration management for the AI Agent application."""
 
-import os
+from typing import Annotated, Any, List, Optional
 
-from dotenv import load_dotenv
-from pydantic_settings import BaseSettings
-
-# Load environment variables from .env file
-load_dotenv()
+from pydantic import field_validator
+from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
 
 
 class Settings(BaseSettings):
-    """Application settings."""
+    """Application settings.
+
+    Every field can be overridden by the matching (case-insensitive)
+    environment variable or `.env` entry.
+    """
+
+    model_config = SettingsConfigDict(
+        env_file=".env", case_sensitive=False, extra="ignore"
+    )
 
     # API settings
-    api_host: str = os.getenv("API_HOST", "0.0.0.0")
-    api_port: int = int(os.getenv("API_PORT", "8000"))
-    api_reload: bool = os.getenv("API_RELOAD", "true").lower() == "true"
+    api_host: str = "0.0.0.0"
+    api_port: int = 8000
+    api_reload: bool = True
+    # Each worker process runs its own API tester, so scale with care
+    api_workers: int = 1
+    # Seconds to keep idle HTTP connections open
+    api_timeout_keep_alive: int = 30
+    # Max concurrent connections and tasks before uvicorn answers 503
+    api_limit_concurrency: Optional[int] = 1024
+    api_backlog: int = 2048
+    # Log level for the application and uvicorn (debug, info, warning, ...)
+    log_level: str = "info"
+    # Serve the API docs and OpenAPI schema under /api/v1 (disable in production)
+    enable_docs: bool = True
+    # Size of the threadpool that runs sync endpoints and dependencies
+    threadpool_size: int = 40
+    # Comma-separated list of origins allowed to call the API from a browser
+    cors_origins: Annotated[List[str], NoDecode] = [
+        "http://localhost:3000",
+        "http://localhost:8000",
+    ]
 
     # API tester settings
     api_tester_enabled: bool = True
@@ -23,41 +46,57 @@ class Settings(BaseSettings):
         20 * 60 * 1000
     )  # 20 minutes base interval, every ~10 mins in peak times
     api_tester_jitter_percent: int = 10
+    api_tester_max_connections: int = 10
+    api_tester_max_keepalive: int = 5
+    api_tester_seed: Optional[int] = None  # Set for reproducible call sequences
 
     # OpenAI settings
-    openai_api_key: str = os.getenv("OPENAI_API_KEY", "")
+    openai_api_key: str = ""
     agent_model: str = "gpt-5-mini"
     light_model: str = "gpt-5-nano"
+    # Max agent runs in flight across all API requests
+    llm_concurrency: int = 32
+    # Max purchases accepted in one /buy-plants/bulk request
+    bulk_max_requests: int = 10
+    openai_max_connections: int = 100
+    openai_max_keepalive: int = 20
+
+    # Response cache settings
+    # Purchases have side effects, so caching /buy-plants responses is opt-in
+    response_cache_enabled: bool = False
+    response_cache_maxsize: int = 1024
+    response_cache_ttl: float = 3600
 
     # MCP settings
     mcp_server_url: str = (
         "https://p01--empower-mcp--wc4d2bfkjcxy.kr842zyvg5.code.run/mcp"
     )
+    # Comma-separated MCP tools exposed to the agent (empty to expose all)
+    mcp_allowed_tools: str = "get_products"
 
     # Security
-    secret_key: str = os.getenv("SECRET_KEY", "your-secret-key-change-this")
+    secret_key: str = "your-secret-key-change-this"
 
     # Agent Configuration
-    agent_name: str = os.getenv("AGENT_NAME", "EmpowerPlantAgent")
-    agent_description: str = os.getenv(
-        "AGENT_DESCRIPTION", "An AI agent for plant empowerment tasks"
-    )
-    max_tokens: int = int(os.getenv("MAX_TOKENS", "1000"))
-    temperature: float = float(os.getenv("TEMPERATURE", "0.7"))
+    agent_name: str = "EmpowerPlantAgent"
+    agent_description: str = "An AI agent for plant empowerment tasks"
+    max_tokens: int = 1000
+    temperature: float = 0.7
 
     # Sentry Configuration
-    sentry_dsn: str = os.getenv("SENTRY_DSN", "")
-    sentry_environment: str = os.getenv("SENTRY_ENVIRONMENT", "development")
-    sentry_traces_sample_rate: float = float(
-        os.getenv("SENTRY_TRACES_SAMPLE_RATE", "1.0")
-    )
-    sentry_profiles_sample_rate: float = float(
-        os.getenv("SENTRY_PROFILES_SAMPLE_RATE", "1.0")
-    )
+    sentry_dsn: str = ""
+    sentry_environment: str = "development"
+    sentry_traces_sample_rate: float = 1.0
+    sentry_profiling_enabled: bool = False
+    sentry_profiles_sample_rate: float = 1.0
 
-    class Config:
-        env_file = ".env"
-        case_sensitive = False
+    @field_validator("cors_origins", mode="before")
+    @classmethod
+    def _split_cors_origins(cls, value: Any) -> Any:
+        """Parse a comma-separated origin list from the environment."""
+        if isinstance(value, str):
+            return [origin.strip() for origin in value.split(",") if origin.strip()]
+        return value
 
 
 # Instantiate settings
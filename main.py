@@ -12,33 +12,75 @@ Configuration:
   (default: 30)
 """
 
+import asyncio
+import importlib.util
+import logging
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, Dict
 
-import sentry_sdk
+import httpx
+import orjson
 import uvicorn
-from fastapi import FastAPI
+from agents import set_default_openai_client
+from anyio import to_thread
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
-from sentry_sdk.integrations.fastapi import FastApiIntegration
-from sentry_sdk.integrations.openai import OpenAIIntegration
-from sentry_sdk.integrations.openai_agents import OpenAIAgentsIntegration
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from fastapi.routing import APIRoute
+from openai import AsyncOpenAI
 
 from app.api.routes import router
 from app.jobs import api_tester
 from config import settings
 
-sentry_sdk.init(
-    dsn=settings.sentry_dsn,
-    environment=settings.sentry_environment,
-    traces_sample_rate=settings.sentry_traces_sample_rate,
-    profiles_sample_rate=settings.sentry_profiles_sample_rate,
-    integrations=[
-        FastApiIntegration(),
-        OpenAIAgentsIntegration(),
-    ],
-    disabled_integrations=[OpenAIIntegration()],
-    send_default_pii=True,
-)
+logging.basicConfig(level=settings.log_level.upper())
+logger = logging.getLogger(__name__)
+
+
+# Probe endpoints are hit constantly and aren't worth tracing or profiling
+UNTRACED_PATHS = frozenset({"/", "/api/v1/health"})
+
+
+def traces_sampler(sampling_context: Dict[str, Any]) -> float:
+    """Sample transactions at the configured rate, except for probe endpoints."""
+    if sampling_context.get("asgi_scope", {}).get("path") in UNTRACED_PATHS:
+        return 0.0
+    return settings.sentry_traces_sample_rate
+
+
+def init_sentry() -> None:
+    """Initialize Sentry, importing the SDK only when it is actually used."""
+    import sentry_sdk
+    from sentry_sdk.integrations.fastapi import FastApiIntegration
+    from sentry_sdk.integrations.openai import OpenAIIntegration
+    from sentry_sdk.integrations.openai_agents import OpenAIAgentsIntegration
+
+    sentry_sdk.init(
+        dsn=settings.sentry_dsn,
+        environment=settings.sentry_environment,
+        traces_sampler=traces_sampler,
+        # The profiler has a per-frame cost, so it has to be enabled explicitly.
+        # Only sampled transactions are profiled, so probes are never profiled.
+        profiles_sample_rate=(
+            settings.sentry_profiles_sample_rate
+            if settings.sentry_profiling_enabled
+            else 0.0
+        ),
+        integrations=[
+            FastApiIntegration(),
+            OpenAIAgentsIntegration(),
+        ],
+        disabled_integrations=[OpenAIIntegration()],
+        send_default_pii=True,
+    )
+
+
+# Only set up Sentry when a DSN is configured, so unconfigured deployments don't
+# pay for importing it or for its instrumentation hooks. This has to happen
+# before the app is created for the FastAPI integration to hook into it.
+if settings.sentry_dsn:
+    init_sentry()
 
 
 @asynccontextmanager
@@ -46,57 +88,110 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan context manager."""
     print("🚀 Starting Simple Plant Care API...")
 
-    # Start the API tester background task
-    try:
-        await api_tester.start()
-    except Exception as e:
-        print(f"⚠️  API tester failed to start: {e}")
-
-    yield
-
-    # Stop the API tester background task
+    # Surface API routes that still re-validate their responses on every request
+    for route in api.routes:
+        if isinstance(route, APIRoute) and route.response_model is not None:
+            logger.info("Route %s validates its response model", route.path)
+
+    # Build the OpenAPI schema up front so the first docs hit doesn't pay for it
+    if api.openapi_url:
+        api.openapi()
+
+    # Size the threadpool that runs sync endpoints and dependencies
+    to_thread.current_default_thread_limiter().total_tokens = settings.threadpool_size
+
+    # Share one pooled HTTP/2 client across all OpenAI calls made by the agents
+    app.state.http_client = httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(
+            max_connections=settings.openai_max_connections,
+            max_keepalive_connections=settings.openai_max_keepalive,
+        ),
+    )
     try:
-        await api_tester.stop()
-    except Exception as e:
-        print(f"⚠️  API tester failed to stop gracefully: {e}")
+        if settings.openai_api_key:
+            set_default_openai_client(
+                AsyncOpenAI(
+                    api_key=settings.openai_api_key, http_client=app.state.http_client
+                )
+            )
+
+        # Run the API tester in the background; it logs its own errors, so a
+        # failing tester never affects startup or the running app
+        tester_task = asyncio.create_task(api_tester.run())
+        try:
+            yield
+        finally:
+            api_tester.request_stop()
+            await tester_task
+    finally:
+        await app.state.http_client.aclose()
 
     print("🛑 Shutting down Simple Plant Care API...")
 
 
-# Create FastAPI app
-app = FastAPI(
+# Create the API sub-application. It is mounted under /api/v1, so its routes
+# are only matched once a request is known to fall under that prefix.
+api = FastAPI(
     title="Simple Plant Care API",
     description="Simple AI plant care assistant - just provide a plant name!",
     version="1.0.0",
-    docs_url="/docs",
-    redoc_url="/redoc",
+    docs_url="/docs" if settings.enable_docs else None,
+    redoc_url="/redoc" if settings.enable_docs else None,
+    openapi_url="/openapi.json" if settings.enable_docs else None,
+    default_response_class=ORJSONResponse,
+)
+api.include_router(router, tags=["agent"])
+
+# Create FastAPI app; the API docs are served by the sub-application
+app = FastAPI(
+    title="Simple Plant Care API",
+    version="1.0.0",
+    docs_url=None,
+    redoc_url=None,
+    openapi_url=None,
+    default_response_class=ORJSONResponse,
     lifespan=lifespan,
 )
 
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Configure appropriately for production
+    allow_origins=settings.cors_origins,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["Authorization", "Content-Type"],
+    max_age=86400,  # Let browsers cache preflight responses for a day
 )
 
-# Include API routes
-app.include_router(router, prefix="/api/v1", tags=["agent"])
+# Compress larger responses such as agent output
+app.add_middleware(GZipMiddleware, minimum_size=500, compresslevel=5)
 
+# Mount API routes
+app.mount("/api/v1", api)
 
-@app.get("/")  # type: ignore[misc]
-async def root() -> dict[str, str]:
-    """Root endpoint with basic information."""
-    return {
+
+# Static payload for the root endpoint, serialized once at import. A fresh
+# Response wraps it per request, since middleware mutates response headers.
+ROOT_BODY = orjson.dumps(
+    {
         "message": "Welcome to the Simple Plant Care API",
-        "docs": "/docs",
+        "docs": "/api/v1/docs",
         "health": "/api/v1/health",
         "agent_info": "/api/v1/agent/info",
         "plant_care": "/api/v1/plant-care",
         "version": "1.0.0",
     }
+)
+ROOT_HEADERS = {"Cache-Control": "public, max-age=3600"}
+
+
+@app.get("/")  # type: ignore[misc]
+async def root() -> Response:
+    """Root endpoint with basic information."""
+    return Response(
+        content=ROOT_BODY, media_type="application/json", headers=ROOT_HEADERS
+    )
 
 
 if __name__ == "__main__":
@@ -105,4 +200,14 @@ if __name__ == "__main__":
         host=settings.api_host,
         port=settings.api_port,
         reload=settings.api_reload,
+        workers=1 if settings.api_reload else settings.api_workers,
+        # uvloop and httptools ship with uvicorn[standard]; fall back to the
+        # pure-Python implementations where they can't be installed (e.g. Windows)
+        loop="uvloop" if importlib.util.find_spec("uvloop") else "asyncio",
+        http="httptools" if importlib.util.find_spec("httptools") else "h11",
+        access_log=False,
+        timeout_keep_alive=settings.api_timeout_keep_alive,
+        limit_concurrency=settings.api_limit_concurrency,
+        backlog=settings.api_backlog,
+        log_level=settings.log_level,
     )